@@ -0,0 +1,45 @@
+"""Add GIN indexes for tags and full-text search.
+
+Revision ID: add_search_indexes
+Revises: manual_initial
+Create Date: 2026-08-27 10:12:04.118220
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_search_indexes"
+down_revision: str | None = "manual_initial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "events_search_idx", "events", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+    op.create_index("events_tags_idx", "events", ["tags"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("events_tags_idx", table_name="events")
+    op.drop_index("events_search_idx", table_name="events")
+    op.drop_column("events", "search_vector")
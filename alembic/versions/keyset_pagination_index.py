@@ -0,0 +1,32 @@
+"""Add composite (timestamp DESC, id DESC) index for keyset pagination.
+
+Revision ID: keyset_pagination_index
+Revises: weighted_search_vector
+Create Date: 2026-08-27 12:27:33.481906
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "keyset_pagination_index"
+down_revision: str | None = "weighted_search_vector"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "events_ts_id_desc_idx",
+        "events",
+        [sa.text("timestamp DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("events_ts_id_desc_idx", table_name="events")
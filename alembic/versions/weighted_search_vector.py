@@ -0,0 +1,52 @@
+"""Weight title over description in the search vector.
+
+Revision ID: weighted_search_vector
+Revises: add_search_indexes
+Create Date: 2026-08-27 11:40:51.902317
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "weighted_search_vector"
+down_revision: str | None = "add_search_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+WEIGHTED = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+UNWEIGHTED = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+
+def _replace_search_vector(expression: str) -> None:
+    # Generated-column expressions cannot be altered in place
+    op.drop_index("events_search_idx", table_name="events")
+    op.drop_column("events", "search_vector")
+    op.add_column(
+        "events",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(expression, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "events_search_idx", "events", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+
+
+def upgrade() -> None:
+    _replace_search_vector(WEIGHTED)
+
+
+def downgrade() -> None:
+    _replace_search_vector(UNWEIGHTED)
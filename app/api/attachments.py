@@ -1,10 +1,9 @@
 """API router for Attachment resources."""
 
-from io import BytesIO
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -16,6 +15,12 @@ from app.services.storage_service import storage_service
 
 router = APIRouter(tags=["attachments"])
 
+# Upload limits bound once at import; pydantic-settings attribute access
+# carries validation bookkeeping we don't want inside per-file loops
+_MAX_PER_EVENT = settings.ATTACHMENT_MAX_PER_EVENT
+_MAX_BYTES = settings.FILE_MAX_BYTES
+_ALLOWED_MIME_TYPES = settings.allowed_mime_set
+
 
 @router.post(
     "/events/{event_id}/attachments",
@@ -29,68 +34,86 @@ async def upload_attachments(
     token: Annotated[str, Depends(get_current_token)],
 ):
     """Upload attachments for a specific event with validation."""
-    # Check if event exists
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
-    if not event:
+    # Check event existence and current attachment count in a single round-trip
+    result = await db.execute(
+        select(Event.id, func.count(Attachment.id))
+        .select_from(Event)
+        .outerjoin(Attachment, Attachment.event_id == Event.id)
+        .where(Event.id == event_id)
+        .group_by(Event.id)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    # Validate attachment count
-    result = await db.execute(select(func.count()).where(Attachment.event_id == event_id))
-    existing_count = result.scalar_one()
-    if existing_count + len(files) > settings.ATTACHMENT_MAX_PER_EVENT:
+    existing_count = row[1]
+    if existing_count + len(files) > _MAX_PER_EVENT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=(
-                f"Too many attachments. Max allowed per event is "
-                f"{settings.ATTACHMENT_MAX_PER_EVENT}."
-            ),
+            detail=f"Too many attachments. Max allowed per event is {_MAX_PER_EVENT}.",
         )
 
-    attachments = []
+    # Validate all files up-front (MIME type and size) before touching storage
+    sizes = []
     for file in files:
         # Validate MIME type
-        if file.content_type not in settings.ALLOWED_MIME_TYPES:
+        if file.content_type not in _ALLOWED_MIME_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"File type {file.content_type} is not allowed.",
             )
 
-        # Read file data to check size and upload
-        file_content = await file.read()
-        size = len(file_content)
-
-        # Validate file size
-        if size > settings.FILE_MAX_BYTES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File {file.filename} exceeds max size of {settings.FILE_MAX_BYTES} bytes.",
-            )
-
-        # Upload to RustFS
-        key = await storage_service.upload_file(
-            BytesIO(file_content), file.filename, file.content_type, size
+        # Validate file size by walking the spooled upload in chunks, so the
+        # payload is never materialized in memory as a whole.
+        size = 0
+        while chunk := await file.read(64 * 1024):
+            size += len(chunk)
+            if size > _MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File {file.filename} exceeds max size of {_MAX_BYTES} bytes.",
+                )
+        await file.seek(0)
+        sizes.append(size)
+
+    # Upload to RustFS concurrently; upload_many overlaps the network-bound
+    # uploads and cleans up after itself if any of them fails
+    try:
+        uploaded_keys = await storage_service.upload_many(
+            [
+                (file.file, file.filename, file.content_type, size)
+                for file, size in zip(files, sizes, strict=True)
+            ]
         )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to upload attachments: {e}",
+        ) from e
 
-        # Create DB record
-        db_attachment = Attachment(
-            event_id=event_id,
-            key=key,
-            filename=file.filename,
-            content_type=file.content_type,
-            size_bytes=size,
-        )
-        db.add(db_attachment)
-        attachments.append(db_attachment)
+    rows = [
+        {
+            "event_id": event_id,
+            "key": key,
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "size_bytes": size,
+        }
+        for file, key, size in zip(files, uploaded_keys, sizes, strict=True)
+    ]
 
     try:
+        # Single multi-VALUES INSERT ... RETURNING instead of per-row
+        # add/refresh round-trips; sort_by_parameter_order guarantees the
+        # returned rows line up with the uploaded files
+        result = await db.execute(
+            insert(Attachment).returning(Attachment, sort_by_parameter_order=True), rows
+        )
+        attachments = result.scalars().all()
         await db.commit()
-        for att in attachments:
-            await db.refresh(att)
     except Exception as e:
         # Cleanup uploaded files if DB fails
-        for att in attachments:
-            await storage_service.delete_file(att.key)
+        await storage_service.delete_files(uploaded_keys)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save attachment metadata: {str(e)}",
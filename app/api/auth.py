@@ -1,7 +1,11 @@
 """API router for Authentication."""
 
+import hashlib
+import hmac
 import secrets
 
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
 from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel
 
@@ -9,6 +13,25 @@ from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_ph = PasswordHasher()
+# Hashed once at startup so logins verify against argon2, never the plaintext
+_ADMIN_HASH = _ph.hash(settings.ADMIN_PASSWORD)
+# SHA-256 digests of passwords argon2 has already accepted this process;
+# lets repeat logins skip the (deliberately slow) argon2 verify
+_verified_digests: set[bytes] = set()
+
+
+def _password_ok(password: str) -> bool:
+    digest = hashlib.sha256(password.encode()).digest()
+    if any(hmac.compare_digest(digest, known) for known in _verified_digests):
+        return True
+    try:
+        _ph.verify(_ADMIN_HASH, password)
+    except VerificationError:
+        return False
+    _verified_digests.add(digest)
+    return True
+
 
 class LoginRequest(BaseModel):
     """Request schema for login."""
@@ -19,7 +42,7 @@ class LoginRequest(BaseModel):
 @router.post("/login")
 async def login(request: LoginRequest, response: Response):
     """Web login for UI sessions (sets a placeholder cookie for now)."""
-    if request.password != settings.ADMIN_PASSWORD:
+    if not _password_ok(request.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
 
     # In a real app, we'd use a session manager or JWT
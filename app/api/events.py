@@ -3,7 +3,8 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -13,6 +14,20 @@ from app.services.event_service import EventService
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Built once at import and reused; dump_json serializes the validated model
+# straight to JSON bytes in pydantic-core, with no intermediate dict
+_EVENT_READ = TypeAdapter(EventRead)
+_PAGINATED_EVENTS = TypeAdapter(PaginatedEvents)
+
+
+def _json(adapter: TypeAdapter, obj, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a validated model directly to a JSON response."""
+    return Response(
+        content=adapter.dump_json(obj),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
 
 @router.post("/", response_model=EventRead, status_code=status.HTTP_201_CREATED)
 async def create_event(
@@ -21,7 +36,8 @@ async def create_event(
     token: Annotated[str, Depends(get_current_token)],
 ):
     """Create a new life log event."""
-    return await EventService.create_event(db, event_in)
+    event = await EventService.create_event(db, event_in)
+    return _json(_EVENT_READ, EventRead.model_validate(event), status.HTTP_201_CREATED)
 
 
 @router.get("/", response_model=PaginatedEvents)
@@ -35,10 +51,29 @@ async def list_events(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=200)] = 25,
     sort: SortOrder = SortOrder.NEWEST,
+    before_timestamp: Annotated[
+        datetime | None, Query(description="Keyset cursor: timestamp of the last seen event")
+    ] = None,
+    before_id: Annotated[
+        int | None, Query(description="Keyset cursor: id of the last seen event")
+    ] = None,
 ):
-    """List events with optional filtering and search."""
+    """List events with optional filtering and search.
+
+    Passing both keyset cursor parameters pages with a seek on
+    (timestamp, id) instead of OFFSET; `page` is ignored in that case.
+    """
     skip = (page - 1) * page_size
-    tags_list = tags.split(",") if tags else None
+    before = (
+        (before_timestamp, before_id)
+        if before_timestamp is not None and before_id is not None
+        else None
+    )
+    # Canonicalize tags (strip, dedupe, sort) so equivalent filters bind the
+    # same array parameter and hit the same cached statement/plan
+    tags_list = None
+    if tags:
+        tags_list = sorted({t.strip() for t in tags.split(",") if t.strip()}) or None
 
     items, total = await EventService.list_events(
         db,
@@ -49,9 +84,13 @@ async def list_events(
         start_date=start,
         end_date=end,
         sort=sort,
+        before=before,
     )
 
-    return PaginatedEvents(items=items, total=total, page=page, page_size=page_size)
+    # Returning a Response directly skips FastAPI's second validation pass
+    # over data the service just produced; response_model stays for the docs
+    payload = PaginatedEvents(items=items, total=total, page=page, page_size=page_size)
+    return _json(_PAGINATED_EVENTS, payload)
 
 
 @router.get("/{event_id}", response_model=EventRead)
@@ -64,7 +103,7 @@ async def get_event(
     event = await EventService.get_event(db, event_id)
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-    return event
+    return _json(_EVENT_READ, EventRead.model_validate(event))
 
 
 @router.patch("/{event_id}", response_model=EventRead)
@@ -78,7 +117,7 @@ async def update_event(
     event = await EventService.update_event(db, event_id, event_in)
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-    return event
+    return _json(_EVENT_READ, EventRead.model_validate(event))
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,12 +1,14 @@
 """API router for Data Export."""
 
+from collections.abc import AsyncIterator
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import AsyncSessionLocal
 from app.dependencies import get_current_token
 from app.models import Event
 from app.schemas import EventRead
@@ -14,10 +16,21 @@ from app.schemas import EventRead
 router = APIRouter(prefix="/export", tags=["export"])
 
 
-@router.get("/", response_model=list[EventRead])
-async def export_data(
-    db: Annotated[AsyncSession, Depends(get_db)], token: Annotated[str, Depends(get_current_token)]
-):
-    """Export all events and attachment metadata as JSON."""
-    result = await db.execute(select(Event).order_by(Event.timestamp.desc()))
-    return result.scalars().all()
+async def _event_stream() -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per event using a server-side cursor.
+
+    The generator owns its own session because the response body outlives
+    the request-scoped session dependency.
+    """
+    async with AsyncSessionLocal() as db:
+        stream = await db.stream_scalars(
+            select(Event).order_by(Event.timestamp.desc()).execution_options(yield_per=500)
+        )
+        async for event in stream:
+            yield orjson.dumps(EventRead.model_validate(event).model_dump()) + b"\n"
+
+
+@router.get("/")
+async def export_data(token: Annotated[str, Depends(get_current_token)]) -> StreamingResponse:
+    """Export all events and attachment metadata as NDJSON."""
+    return StreamingResponse(_event_stream(), media_type="application/x-ndjson")
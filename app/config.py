@@ -1,5 +1,7 @@
 """Configuration settings for the LifeLog API."""
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -43,6 +45,11 @@ class Settings(BaseSettings):
         "video/mp4",
     ]
 
+    @cached_property
+    def allowed_mime_set(self) -> frozenset[str]:
+        """Allowed MIME types as a frozenset for O(1) membership checks."""
+        return frozenset(self.ALLOWED_MIME_TYPES)
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
@@ -5,7 +5,15 @@ from sqlmodel import SQLModel
 
 from app.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+    # Large enough that the app's statements stay compiled after warmup
+    query_cache_size=1200,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
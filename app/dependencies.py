@@ -1,42 +1,67 @@
-"""FastAPI dependencies for the LifeLog API."""
+"""FastAPI dependencies and auth middleware for the LifeLog API."""
 
-from typing import Annotated
+import hashlib
+import hmac
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import HTTPException, Request, status
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
 
 from app.config import settings
 
-security_scheme = HTTPBearer(auto_error=False)
+# Fixed-width digest so the hot-path compare never sees the raw token length
+_TOKEN_DIGEST = hashlib.sha256(settings.ADMIN_PASSWORD.encode()).digest()
 
+# API paths that must stay reachable without a token (the login endpoint)
+_PUBLIC_PREFIXES = (f"{settings.API_V1_STR}/auth",)
 
-async def get_current_token(
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security_scheme)],
-):
-    """Dependency to validate the token from the request header.
+
+def _unauthorized(detail: str) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class BearerAuthMiddleware(BaseHTTPMiddleware):
+    """Validate the bearer token once at the edge for all API routes.
+
+    Doing the check here replaces per-endpoint HTTPBearer parsing with a
+    single constant-time compare per request; endpoints that need the token
+    read it back from ``request.state`` via :func:`get_current_token`.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        """Reject unauthenticated API requests before they reach the router."""
+        path = request.url.path
+        if path.startswith(f"{settings.API_V1_STR}/") and not path.startswith(_PUBLIC_PREFIXES):
+            scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return _unauthorized("Authentication required")
+            if not hmac.compare_digest(hashlib.sha256(token.encode()).digest(), _TOKEN_DIGEST):
+                return _unauthorized("Invalid authentication credentials")
+            request.state.token = token
+        return await call_next(request)
+
+
+async def get_current_token(request: Request) -> str:
+    """Dependency returning the token validated by BearerAuthMiddleware.
 
     Args:
-        credentials (HTTPAuthorizationCredentials): The credentials from the Authorization header.
+        request (Request): The current request.
 
     Returns:
         str: The validated token.
 
     Raises:
-        HTTPException: If the token is missing or invalid.
+        HTTPException: If the middleware did not validate a token.
     """
-    if not credentials:
+    token = getattr(request.state, "token", None)
+    if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required",
             headers={"WWW-Authenticate": "Bearer"},
         )
-
-    token = credentials.credentials
-
-    if token != settings.ADMIN_PASSWORD:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
     return token
@@ -5,39 +5,30 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, Query
-from minio import Minio
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import attachments, auth, events, export
 from app.config import settings
 from app.database import get_db
-from app.dependencies import get_current_token
+from app.dependencies import BearerAuthMiddleware, get_current_token
 from app.schemas import PaginatedEvents, SortOrder
-
-# RustFS Client Global
-rustfs_client = None
+from app.services.storage_service import storage_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events.
 
-    Initializes the RustFS client and ensures the required bucket exists.
+    Ensures the required RustFS bucket exists using the shared client.
     """
     # Startup
-    global rustfs_client
     print("Starting up LifeLog...")
 
-    # Initialize RustFS
+    # One pooled client serves both bootstrap and request traffic
     try:
-        rustfs_client = Minio(
-            settings.RUSTFS_ENDPOINT,
-            access_key=settings.RUSTFS_ACCESS_KEY,
-            secret_key=settings.RUSTFS_SECRET_KEY,
-            secure=settings.RUSTFS_SECURE,
-        )
-        if not rustfs_client.bucket_exists(settings.RUSTFS_BUCKET):
-            rustfs_client.make_bucket(settings.RUSTFS_BUCKET)
+        if not storage_service.client.bucket_exists(settings.RUSTFS_BUCKET):
+            storage_service.client.make_bucket(settings.RUSTFS_BUCKET)
             print(f"Created RustFS bucket: {settings.RUSTFS_BUCKET}")
     except Exception as e:
         print(f"Error connecting to RustFS: {e}")
@@ -48,7 +39,9 @@ async def lifespan(app: FastAPI):
     print("Shutting down LifeLog...")
 
 
-app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan, default_response_class=ORJSONResponse)
+
+app.add_middleware(BearerAuthMiddleware)
 
 
 # Include API routers
@@ -81,6 +74,14 @@ async def search_events_alias(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=200)] = 25,
     sort: SortOrder = SortOrder.NEWEST,
+    before_timestamp: Annotated[
+        datetime | None, Query(description="Keyset cursor: timestamp of the last seen event")
+    ] = None,
+    before_id: Annotated[
+        int | None, Query(description="Keyset cursor: id of the last seen event")
+    ] = None,
 ):
     """Alias for GET /api/events."""
-    return await events.list_events(db, token, q, tags, start, end, page, page_size, sort)
+    return await events.list_events(
+        db, token, q, tags, start, end, page, page_size, sort, before_timestamp, before_id
+    )
@@ -3,12 +3,14 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import BigInteger, Column, Computed, DateTime, ForeignKey, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlmodel import Field, Relationship
 
 from app.database import Base
 
+__all__ = ["Attachment", "Event"]
+
 
 class Event(Base, table=True):
     """Represents a log entry or event in the LifeLog system."""
@@ -28,9 +30,18 @@ class Event(Base, table=True):
     tags: Any = Field(default=None, sa_column=Column(ARRAY(Text)))
     metadata_json: Any = Field(default=None, sa_column=Column("metadata", JSONB))
 
-    # For now, we'll assume the search_vector will be handled via Alembic migrations
-    # to add the GENERATED ALWAYS AS column or triggers, as SQLAlchemy support for
-    # generated tsvector columns can be verbose.
+    # Stored generated column kept in sync by Postgres; never written by the app
+    search_vector: Any = Field(
+        default=None,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
 
     attachments: list[Attachment] = Relationship(
         back_populates="event",
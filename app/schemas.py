@@ -5,12 +5,24 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+__all__ = [
+    "AttachmentBase",
+    "AttachmentRead",
+    "EventBase",
+    "EventCreate",
+    "EventRead",
+    "EventUpdate",
+    "PaginatedEvents",
+    "SortOrder",
+]
+
 
 class SortOrder(str, Enum):
     """Sorting order for events."""
 
     NEWEST = "newest"
     OLDEST = "oldest"
+    RELEVANCE = "relevance"
 
 
 class AttachmentBase(BaseModel):
@@ -1,37 +1,51 @@
 """Service layer for handling Event business logic and database operations."""
 
+import asyncio
+import contextlib
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models import Event
+from app.database import AsyncSessionLocal
+from app.models import Attachment, Event
 from app.schemas import EventCreate, EventUpdate, SortOrder
 
+# Deletes the event and reports its attachment keys in one statement; the
+# attachments rows themselves go with the event via ON DELETE CASCADE
+_DELETE_EVENT_WITH_KEYS = text(
+    """
+    WITH keys AS (SELECT key FROM attachments WHERE event_id = :event_id),
+         del AS (DELETE FROM events WHERE id = :event_id RETURNING id)
+    SELECT del.id, keys.key FROM del LEFT JOIN keys ON TRUE
+    """
+)
+
 
 class EventService:
     """Service layer for event-related database operations."""
 
     @staticmethod
     async def create_event(db: AsyncSession, event_in: EventCreate) -> Event:
-        """Create a new event."""
-        db_event = Event.model_validate(event_in)
-        if not db_event.timestamp:
-            db_event.timestamp = datetime.now()
-        db.add(db_event)
+        """Create a new event with a single INSERT ... RETURNING."""
+        values = event_in.model_dump()
+        if not values.get("timestamp"):
+            values["timestamp"] = datetime.now(UTC)
+
+        stmt = insert(Event).values(**values).returning(Event)
+        db_event = (await db.execute(stmt)).scalar_one()
+        # A brand-new event has no attachments; install the empty collection
+        # so serialization never triggers a lazy load
+        set_committed_value(db_event, "attachments", [])
         await db.commit()
-        # Refresh with attachments to ensure they are available for serialization
-        await db.refresh(db_event, ["attachments"])
         return db_event
 
     @staticmethod
     async def get_event(db: AsyncSession, event_id: int) -> Event | None:
         """Get an event by ID with its attachments."""
-        result = await db.execute(
-            select(Event).where(Event.id == event_id).options(selectinload(Event.attachments))
-        )
+        result = await db.execute(select(Event).where(Event.id == event_id))
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -44,58 +58,108 @@ class EventService:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         sort: SortOrder = SortOrder.NEWEST,
+        before: tuple[datetime, int] | None = None,
     ) -> tuple[Sequence[Event], int]:
-        """List events with filtering, search, and pagination."""
-        stmt = select(Event).options(selectinload(Event.attachments))
+        """List events with filtering, search, and pagination.
+
+        When a ``before`` cursor (timestamp, id of the last seen event) is
+        given, the page is fetched with a keyset seek instead of OFFSET, so
+        deep pages cost the same as the first one.
+        """
+        # WHERE clauses shared by the page query and the count query
+        conditions = []
 
-        # Filtering
         if tags:
             # PostgreSQL array overlap operator &&
-            stmt = stmt.where(Event.tags.overlap(tags))
+            conditions.append(Event.tags.overlap(tags))
 
         if start_date:
-            stmt = stmt.where(Event.timestamp >= start_date)
+            conditions.append(Event.timestamp >= start_date)
 
         if end_date:
-            stmt = stmt.where(Event.timestamp <= end_date)
+            conditions.append(Event.timestamp <= end_date)
 
-        # Full Text Search (Basic implementation for now, should use tsvector in production)
+        # Full Text Search against the stored tsvector, served by its GIN
+        # index. The raw query string is only ever a bound parameter to
+        # websearch_to_tsquery, so no LIKE-style escaping of % or _ applies.
+        tsquery = None
         if query:
-            # We use ILIKE for a simple case-insensitive search if search_vector is not yet used
-            stmt = stmt.where(
-                (Event.title.ilike(f"%{query}%")) | (Event.description.ilike(f"%{query}%"))
-            )
-
-        # Total count before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await db.execute(count_stmt)).scalar_one()
-
-        # Sorting
-        if sort == SortOrder.NEWEST:
-            stmt = stmt.order_by(Event.timestamp.desc())
-        else:
-            stmt = stmt.order_by(Event.timestamp.asc())
-
-        # Pagination
-        stmt = stmt.offset(skip).limit(limit)
-
-        result = await db.execute(stmt)
+            tsquery = func.websearch_to_tsquery("english", query)
+            conditions.append(Event.search_vector.op("@@")(tsquery))
+
+        stmt = select(Event).where(*conditions)
+        # Bare aggregate over the same predicates; no eager-load options and
+        # no derived table for the planner to work around
+        count_stmt = select(func.count(Event.id)).where(*conditions)
+
+        # Relevance ranking has no stable keyset, so cursors only apply to
+        # the time-ordered sorts; dropping the cursor here keeps the seek and
+        # OFFSET mutually exclusive below
+        if sort == SortOrder.RELEVANCE:
+            before = None
+
+        stmt = EventService._apply_page_order(stmt, sort, tsquery, before)
+
+        # Pagination: keyset seek when a cursor is given, OFFSET otherwise
+        if before is None:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(limit)
+
+        async def _count() -> int:
+            # An AsyncSession cannot run two statements at once, so the count
+            # borrows its own pooled session for the duration of the gather
+            async with AsyncSessionLocal() as count_db:
+                return (await count_db.execute(count_stmt)).scalar_one()
+
+        total, result = await asyncio.gather(_count(), db.execute(stmt))
         return result.scalars().all(), total
 
+    @staticmethod
+    def _apply_page_order(stmt, sort: SortOrder, tsquery, before: tuple[datetime, int] | None):
+        """Apply ordering and the optional keyset seek to the page query.
+
+        Relevance only makes sense alongside a search query, and id breaks
+        timestamp ties so the keyset cursor is unambiguous.
+        """
+        if sort == SortOrder.RELEVANCE and tsquery is not None:
+            return stmt.order_by(
+                func.ts_rank_cd(Event.search_vector, tsquery).desc(), Event.timestamp.desc()
+            )
+        if sort == SortOrder.OLDEST:
+            stmt = stmt.order_by(Event.timestamp.asc(), Event.id.asc())
+            if before is not None:
+                stmt = stmt.where(tuple_(Event.timestamp, Event.id) > before)
+            return stmt
+        stmt = stmt.order_by(Event.timestamp.desc(), Event.id.desc())
+        if before is not None:
+            stmt = stmt.where(tuple_(Event.timestamp, Event.id) < before)
+        return stmt
+
     @staticmethod
     async def update_event(db: AsyncSession, event_id: int, event_in: EventUpdate) -> Event | None:
-        """Partially update an event."""
-        db_event = await EventService.get_event(db, event_id)
+        """Partially update an event with a single UPDATE ... RETURNING."""
+        # Equivalent to model_dump(exclude_unset=True) without serializing
+        # the whole model to an intermediate dict
+        update_data = {field: getattr(event_in, field) for field in event_in.model_fields_set}
+        if not update_data:
+            # Nothing to change; return the current state. get_event is the
+            # right fetch here since the response serializes attachments.
+            return await EventService.get_event(db, event_id)
+
+        stmt = update(Event).where(Event.id == event_id).values(**update_data).returning(Event)
+        db_event = (await db.execute(stmt)).scalar_one_or_none()
         if not db_event:
             return None
 
-        update_data = event_in.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_event, key, value)
-
-        db.add(db_event)
+        # Populate attachments for serialization without marking the
+        # freshly-updated instance dirty again
+        attachments = (
+            (await db.execute(select(Attachment).where(Attachment.event_id == event_id)))
+            .scalars()
+            .all()
+        )
+        set_committed_value(db_event, "attachments", list(attachments))
         await db.commit()
-        await db.refresh(db_event, ["attachments"])
         return db_event
 
     @staticmethod
@@ -103,21 +167,19 @@ class EventService:
         """Delete an event and its associated files from storage."""
         from app.services.storage_service import storage_service
 
-        db_event = await EventService.get_event(db, event_id)
-        if not db_event:
+        # One round-trip: delete the event and collect the attachment keys
+        # that storage cleanup needs from the same snapshot
+        rows = (await db.execute(_DELETE_EVENT_WITH_KEYS, {"event_id": event_id})).all()
+        if not rows:
             return False
 
-        # Pre-fetch attachment keys for storage cleanup
-        attachment_keys = [att.key for att in db_event.attachments]
-
-        await db.delete(db_event)
+        attachment_keys = [row.key for row in rows if row.key]
         await db.commit()
 
-        # Delete from RustFS after DB commit for safety
-        import contextlib
-
-        for key in attachment_keys:
-            with contextlib.suppress(Exception):
-                await storage_service.delete_file(key)
+        # Delete from RustFS after DB commit for safety; one bulk multi-delete
+        # request instead of one round-trip per key. Best-effort: a failed
+        # cleanup must not fail the request.
+        with contextlib.suppress(Exception):
+            await storage_service.delete_files(attachment_keys)
 
         return True
@@ -1,12 +1,17 @@
 """Service layer for handling RustFS storage operations."""
 
 import asyncio
+import functools
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import BinaryIO
 
 from minio import Minio
+from minio.deleteobjects import DeleteObject
+from urllib3 import PoolManager, Retry
 
 from app.config import settings
 
@@ -14,45 +19,151 @@ from app.config import settings
 class StorageService:
     """Service layer for RustFS storage operations."""
 
+    # Files above this size are sent as S3 multipart uploads in parts of
+    # this size, so a part can be retried without resending the whole body
+    PART_SIZE = 10 * 1024 * 1024
+
+    # Upper bound on concurrent blocking storage calls
+    EXECUTOR_WORKERS = 16
+
+    # Upper bound on cached presigned URLs
+    URL_CACHE_MAX = 10_000
+
     def __init__(self):
         """Initialize the RustFS client."""
+        # Keep-alive pool sized for the executor (urllib3 defaults to 10
+        # connections, fewer than the workers that share this client), so
+        # concurrent calls reuse warm connections instead of re-handshaking
+        http_client = PoolManager(
+            maxsize=self.EXECUTOR_WORKERS * 2,
+            retries=Retry(total=3, backoff_factor=0.1),
+        )
         self.client = Minio(
             settings.RUSTFS_ENDPOINT,
             access_key=settings.RUSTFS_ACCESS_KEY,
             secret_key=settings.RUSTFS_SECRET_KEY,
             secure=settings.RUSTFS_SECURE,
+            http_client=http_client,
+        )
+        # Presigned URLs are pure functions of (key, expiry) while they are
+        # valid, so cache them in-process with a TTL shorter than the expiry.
+        self._url_cache: dict[tuple[str, int], tuple[str, float]] = {}
+        # Dedicated executor so blocking storage calls neither queue behind
+        # other to_thread users of the loop's shared pool nor flood the client
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.EXECUTOR_WORKERS, thread_name_prefix="rustfs"
         )
 
+    async def _run(self, fn, /, *args, **kwargs):
+        """Run a blocking client call on the service's own executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
     async def upload_file(
-        self, file_data: BinaryIO, filename: str, content_type: str, size: int
+        self, file_data: BinaryIO, filename: str, content_type: str, size: int | None = None
     ) -> str:
-        """Upload a file to RustFS and return the generated key."""
+        """Upload a file to RustFS and return the generated key.
+
+        Callers that know the payload size should pass it so small files go
+        out as a single PUT; with ``size=None`` the stream is sent as a
+        multipart upload without ever being buffered whole.
+        """
         # Generate unique key
         ext = os.path.splitext(filename)[1]
         key = f"{uuid.uuid4().hex}{ext}"
 
-        await asyncio.to_thread(
-            self.client.put_object,
-            settings.RUSTFS_BUCKET,
-            key,
-            file_data,
-            size,
-            content_type=content_type,
-        )
+        if size is None or size > self.PART_SIZE:
+            # length=-1 + part_size streams the file as a multipart upload
+            await self._run(
+                self.client.put_object,
+                settings.RUSTFS_BUCKET,
+                key,
+                file_data,
+                -1,
+                content_type=content_type,
+                part_size=self.PART_SIZE,
+            )
+        else:
+            await self._run(
+                self.client.put_object,
+                settings.RUSTFS_BUCKET,
+                key,
+                file_data,
+                size,
+                content_type=content_type,
+            )
         return key
 
+    def _invalidate_urls(self, keys: list[str]) -> None:
+        """Drop cached presigned URLs for the given object keys."""
+        doomed = set(keys)
+        for cache_key in [ck for ck in self._url_cache if ck[0] in doomed]:
+            del self._url_cache[cache_key]
+
+    async def upload_many(self, uploads: list[tuple[BinaryIO, str, str, int | None]]) -> list[str]:
+        """Upload several files concurrently, returning their keys in order.
+
+        Each upload is a ``(file_data, filename, content_type, size)`` tuple.
+        If any upload fails, the ones that succeeded are bulk-deleted before
+        the first failure is re-raised, so storage is never left
+        half-populated.
+        """
+        results = await asyncio.gather(
+            *(self.upload_file(*upload) for upload in uploads), return_exceptions=True
+        )
+        failures = [res for res in results if isinstance(res, BaseException)]
+        if failures:
+            await self.delete_files([res for res in results if isinstance(res, str)])
+            raise failures[0]
+        return list(results)
+
     async def get_presigned_url(self, key: str, expires_minutes: int = 15) -> str:
-        """Generate a presigned URL for downloading a file."""
-        return await asyncio.to_thread(
+        """Generate a presigned URL for downloading a file, with caching."""
+        cache_key = (key, expires_minutes)
+        cached = self._url_cache.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        url = await self._run(
             self.client.presigned_get_object,
             settings.RUSTFS_BUCKET,
             key,
             expires=timedelta(minutes=expires_minutes),
         )
+        if len(self._url_cache) >= self.URL_CACHE_MAX:
+            now = time.monotonic()
+            self._url_cache = {ck: v for ck, v in self._url_cache.items() if v[1] > now}
+            if len(self._url_cache) >= self.URL_CACHE_MAX:
+                # Still full of live entries; drop the oldest insertion
+                self._url_cache.pop(next(iter(self._url_cache)))
+        # Keep the cached URL valid for a minute less than the URL itself
+        self._url_cache[cache_key] = (url, time.monotonic() + expires_minutes * 60 - 60)
+        return url
 
     async def delete_file(self, key: str):
         """Delete a file from RustFS."""
-        await asyncio.to_thread(self.client.remove_object, settings.RUSTFS_BUCKET, key)
+        self._invalidate_urls([key])
+        await self._run(self.client.remove_object, settings.RUSTFS_BUCKET, key)
+
+    async def delete_files(self, keys: list[str]):
+        """Delete multiple files from RustFS with a single bulk request."""
+        if not keys:
+            return
+
+        self._invalidate_urls(keys)
+
+        def _remove() -> list[str]:
+            errors = self.client.remove_objects(
+                settings.RUSTFS_BUCKET, [DeleteObject(key) for key in keys]
+            )
+            # remove_objects is lazy; draining the iterator sends the request
+            return [error.name for error in errors]
+
+        failed = await self._run(_remove)
+        if failed:
+            # Fall back to overlapped per-key deletes for anything the bulk
+            # API refused, rather than serializing retries
+            await asyncio.gather(*(self.delete_file(key) for key in failed), return_exceptions=True)
 
 
 storage_service = StorageService()
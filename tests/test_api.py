@@ -34,3 +34,24 @@ def test_search_alias():
     # Without auth, should fail
     response = client.get("/api/search")
     assert response.status_code == 401
+
+
+def test_login_wrong_password():
+    """Test that login rejects a wrong password."""
+    response = client.post("/api/auth/login", json={"password": "not-the-password"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid password"
+
+
+def test_login_sets_session_cookie():
+    """Test that login accepts the admin password and sets a session cookie."""
+    response = client.post("/api/auth/login", json={"password": settings.ADMIN_PASSWORD})
+    assert response.status_code == 200
+    assert response.json() == {"message": "Logged in successfully"}
+    assert "session_id" in response.cookies
+
+    # A repeat login takes the verified-digest fast path and must behave
+    # identically.
+    response = client.post("/api/auth/login", json={"password": settings.ADMIN_PASSWORD})
+    assert response.status_code == 200
+    assert "session_id" in response.cookies
@@ -1,5 +1,7 @@
 """Test end-to-end API functionality."""
 
+import json
+
 import httpx
 import pytest
 
@@ -14,6 +16,91 @@ def auth_headers():
     return {"Authorization": f"Bearer {settings.ADMIN_PASSWORD}"}
 
 
+def test_export_returns_ndjson(auth_headers):
+    """Test that the export endpoint streams one JSON object per line."""
+    event_data = {
+        "title": "E2E Export Event",
+        "description": "Created by E2E export test",
+        "tags": ["test", "e2e-export"],
+    }
+
+    with httpx.Client(base_url=BASE_URL) as client:
+        response = client.post("/api/events/", json=event_data, headers=auth_headers)
+        assert response.status_code == 201, response.text
+        event_id = response.json()["id"]
+
+        try:
+            response = client.get("/api/export/", headers=auth_headers)
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+
+            # Every non-empty line is a standalone JSON object.
+            events = [json.loads(line) for line in response.text.splitlines() if line]
+            assert all(isinstance(event, dict) for event in events)
+            assert event_id in {event["id"] for event in events}
+        finally:
+            client.delete(f"/api/events/{event_id}", headers=auth_headers)
+
+
+def test_keyset_cursor_pagination(auth_headers):
+    """Test that a keyset cursor resumes after the last seen row, including ties."""
+    # Three distinct timestamps with a tie in the middle; the tie must be
+    # broken by id for the cursor to be unambiguous.
+    timestamps = [
+        "2025-01-01T12:00:00Z",
+        "2025-01-01T11:00:00Z",
+        "2025-01-01T11:00:00Z",
+        "2025-01-01T10:00:00Z",
+    ]
+    created_ids = []
+
+    with httpx.Client(base_url=BASE_URL) as client:
+        try:
+            for i, timestamp in enumerate(timestamps):
+                response = client.post(
+                    "/api/events/",
+                    json={
+                        "title": f"E2E Keyset Event {i}",
+                        "tags": ["e2e-keyset"],
+                        "timestamp": timestamp,
+                    },
+                    headers=auth_headers,
+                )
+                assert response.status_code == 201, response.text
+                created_ids.append(response.json()["id"])
+
+            # First page, newest first: 12:00, then the tie row with the
+            # higher id.
+            response = client.get(
+                "/api/events/",
+                params={"tags": "e2e-keyset", "page_size": 2},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            first_page = response.json()["items"]
+            assert [e["id"] for e in first_page] == [created_ids[0], created_ids[2]]
+
+            # Resume after the last seen row: the cursor page must start with
+            # the other tie row (same timestamp, lower id), then 10:00.
+            last_seen = first_page[-1]
+            response = client.get(
+                "/api/events/",
+                params={
+                    "tags": "e2e-keyset",
+                    "page_size": 2,
+                    "before_timestamp": last_seen["timestamp"],
+                    "before_id": last_seen["id"],
+                },
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            second_page = response.json()["items"]
+            assert [e["id"] for e in second_page] == [created_ids[1], created_ids[3]]
+        finally:
+            for event_id in created_ids:
+                client.delete(f"/api/events/{event_id}", headers=auth_headers)
+
+
 def test_event_creation_with_attachment(auth_headers):
     """Test event creation with attachment."""
     # 1. Create an event for E2E testing.